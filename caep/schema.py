@@ -2,21 +2,49 @@
 
 
 import argparse
+import copy
+import dataclasses
+import enum
+import functools
+import io
 import re
 import sys
-from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar, cast
-
-import pydantic
-from pydantic import BaseModel, ValidationError
-
-import caep
-
-PYDANTIC_MAJOR_VERSION = pydantic.__version__.split(".")[0]
+import types
+from collections.abc import Mapping, Sequence, Set
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Pattern,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+
+import typing_extensions
+
+from . import config
+
+# pydantic is slow to import, so it is only imported when it is used, and
+# pydantic names exported by this module are resolved lazily (see __getattr__)
+if TYPE_CHECKING:
+    from pydantic import BaseModel
 
 DEFAULT_SPLIT = ","
 
 DEFAULT_KV_SPLIT = ":"
 
+# Translation table for field names to option names (underscore to dash)
+_UND2DASH = str.maketrans("_", "-")
+
+# Translation table for option names to argparse dest (dash to underscore)
+_DASH2UND = str.maketrans("-", "_")
+
 # Map of pydantic schema types to python types
 TYPE_MAPPING: Dict[str, type] = {
     "string": str,
@@ -25,8 +53,40 @@ TYPE_MAPPING: Dict[str, type] = {
     "boolean": bool,
 }
 
+# Map of python types to pydantic schema types
+JSON_TYPE_MAPPING: Dict[type, str] = {
+    python_type: schema_type for schema_type, python_type in TYPE_MAPPING.items()
+}
+
 # Type of BaseModel Subclasses
-BaseModelType = TypeVar("BaseModelType", bound=BaseModel)
+BaseModelType = TypeVar("BaseModelType", bound="BaseModel")
+
+
+@functools.lru_cache(maxsize=None)
+def pydantic_major_version() -> str:
+    """Major version of installed pydantic"""
+    import pydantic
+
+    return pydantic.__version__.split(".")[0]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazy lookup of pydantic names (PEP 562)"""
+
+    if name == "PYDANTIC_MAJOR_VERSION":
+        return pydantic_major_version()
+
+    if name == "BaseModel":
+        from pydantic import BaseModel
+
+        return BaseModel
+
+    if name == "ValidationError":
+        from pydantic import ValidationError
+
+        return ValidationError
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class SchemaError(Exception):
@@ -37,12 +97,30 @@ class FieldError(Exception):
     pass
 
 
-class ArrayInfo(BaseModel):
+# Escaped character (backslash followed by any character)
+UNESCAPE_RE = re.compile(r"\\(.?)", re.DOTALL)
+
+
+@functools.lru_cache(maxsize=None)
+def split_pattern(split: str) -> Pattern[str]:
+    """
+    Compiled pattern that matches the start of the value or a split value,
+    followed by one item (group 1). Escaped characters, including escaped
+    split values, are part of the item.
+    """
+    sep = re.escape(split)
+
+    return re.compile(rf"(?:^|{sep})((?:\\.?|(?!{sep})[^\\])*)", re.DOTALL)
+
+
+class ArrayInfo(NamedTuple):
     array_type: type
     split: str = DEFAULT_SPLIT
+    # Precompiled split pattern (see split_pattern()), compiled on demand if None
+    split_re: Optional[Pattern[str]] = None
 
 
-class DictInfo(BaseModel):
+class DictInfo(NamedTuple):
     dict_type: type
     split: str = DEFAULT_SPLIT
     kv_split: str = DEFAULT_KV_SPLIT
@@ -52,18 +130,213 @@ Arrays = Dict[str, ArrayInfo]
 Dicts = Dict[str, DictInfo]
 
 
+class FieldSpec(NamedTuple):
+    """Precomputed argument specification for a pydantic field"""
+
+    flag: str  # Option string, e.g. --str-arg
+    dest: str  # Attribute name in namespace, e.g. str_arg
+    help: str
+    default: Any
+    type: Optional[type] = None  # None for bools (store_true/store_false)
+    # pylint: disable-next=protected-access
+    action: Type[argparse.Action] = argparse._StoreAction
+
+
+FieldSpecs = Tuple[FieldSpec, ...]
+
+
+# Union origins, including X | Y in python 3.10+
+_UNION_TYPES = (Union, getattr(types, "UnionType", Union))
+
+
+def _annotation_schema(annotation: Any) -> Dict[str, Any]:
+    """
+    JSON schema type information for a pydantic 2.x field annotation
+
+    Only includes "type" and "items"/"additionalProperties" for arrays and
+    objects, which is what we need to build the argument parser. Types that
+    are represented as strings in JSON schema (Path, IPv4Address etc.) are
+    returned as "string". Nested models (pydantic models, dataclasses and
+    TypedDicts), enums, Any and mixed literals are returned without type, and
+    are not supported.
+    """
+    from pydantic import BaseModel
+
+    origin = typing_extensions.get_origin(annotation)
+    args = [
+        arg for arg in typing_extensions.get_args(annotation) if arg is not type(None)
+    ]
+
+    if origin is typing_extensions.Annotated:
+        return _annotation_schema(args[0])
+
+    if origin in _UNION_TYPES:
+        # Same as for anyOf in the JSON schema, the last non null type is used
+        return _annotation_schema(args[-1]) if args else {}
+
+    if origin is typing_extensions.Literal:
+        # Literals with values of different types have no type in JSON schema
+        literal_types = {type(arg) for arg in args}
+        if len(literal_types) != 1:
+            return {}
+        return {"type": JSON_TYPE_MAPPING.get(literal_types.pop(), "string")}
+
+    if isinstance(origin, type) and issubclass(origin, Mapping):
+        return {
+            "type": "object",
+            "additionalProperties": _annotation_schema(args[1]) if args else {},
+        }
+
+    if isinstance(origin, type) and issubclass(origin, (Sequence, Set)):
+        # Only homogeneous tuples (Tuple[int, ...]) have a single item type
+        if issubclass(origin, tuple) and (len(args) != 2 or args[1] is not Ellipsis):
+            return {"type": "array", "items": {}}
+
+        return {
+            "type": "array",
+            "items": _annotation_schema(args[0]) if args else {},
+        }
+
+    # Any (a class in python 3.11+), object and None have no type in JSON schema
+    if (
+        not isinstance(annotation, type)
+        or annotation in (Any, object, type(None))
+        or issubclass(annotation, (BaseModel, enum.Enum))
+        or dataclasses.is_dataclass(annotation)
+        or typing_extensions.is_typeddict(annotation)
+    ):
+        return {}
+
+    if issubclass(annotation, Mapping):
+        return {"type": "object", "additionalProperties": {}}
+
+    if issubclass(annotation, (Sequence, Set)) and not issubclass(
+        annotation, (str, bytes)
+    ):
+        return {"type": "array", "items": {}}
+
+    return {"type": JSON_TYPE_MAPPING.get(annotation, "string")}
+
+
+def _model_fields_schema(
+    model: Type["BaseModel"], alias: bool
+) -> Optional[Dict[str, Dict[str, Any]]]:
+    """
+    Build schema properties for a pydantic 2.x model from `model_fields`
+
+    Returns None if a field has a validation alias we can not resolve to a
+    single name (e.g. AliasPath), use `model_json_schema` for those models.
+    """
+    from pydantic import AliasChoices
+    from pydantic_core import PydanticUndefined, to_jsonable_python
+
+    properties: Dict[str, Dict[str, Any]] = {}
+
+    for name, field_info in model.model_fields.items():
+        schema = _annotation_schema(field_info.annotation)
+
+        if field_info.description is not None:
+            schema["description"] = field_info.description
+
+        # Defaults are represented as in the JSON schema (e.g. sets as lists)
+        if field_info.default is not PydanticUndefined:
+            schema["default"] = to_jsonable_python(field_info.default)
+
+        if isinstance(field_info.json_schema_extra, dict):
+            schema.update(field_info.json_schema_extra)
+
+        if alias:
+            validation_alias = field_info.validation_alias
+
+            # Same as the JSON schema, use the first of the alias choices
+            if isinstance(validation_alias, AliasChoices) and isinstance(
+                validation_alias.choices[0], str
+            ):
+                validation_alias = validation_alias.choices[0]
+
+            if isinstance(validation_alias, str):
+                name = validation_alias
+            elif validation_alias is not None:
+                return None
+            elif field_info.alias:
+                name = field_info.alias
+
+        properties[name] = schema
+
+    return properties
+
+
+@functools.lru_cache(maxsize=None)
+def _get_fields(model: Type["BaseModel"], alias: bool) -> Dict[str, Dict[str, Any]]:
+    """
+    Get all pydantic fields (schema properties) for model
+
+    Building the schema is expensive, and the result will not change for a
+    given model, so it is cached per (model, alias).
+
+    In pydantic 1.x we use the `schema()` method. In pydantic 2.x we build the
+    (subset of the) JSON schema we need directly from `model_fields`, since
+    generating the full JSON schema with `model_json_schema` is expensive.
+    """
+
+    if pydantic_major_version() == "2":
+        fields = _model_fields_schema(model, alias)
+
+        if fields is None:
+            fields = model.model_json_schema(alias).get("properties", {})
+    else:
+        fields = model.schema(alias).get("properties", {})
+
+    if not fields:
+        raise SchemaError(f"Unable to get properties from schema {model}")
+
+    return fields
+
+
 def escape_split(
-    value: str, split: str = DEFAULT_SPLIT, maxsplit: int = 0
+    value: str,
+    split: str = DEFAULT_SPLIT,
+    maxsplit: int = 0,
+    pattern: Optional[Pattern[str]] = None,
 ) -> List[str]:
     """
     Helper method to split on specified field
     (unless field is escaped with backslash)
+
+    pattern can be used to pass a precompiled pattern for the split value
+    (see split_pattern())
     """
 
-    return [
-        re.sub(r"(?<!\\)\\", "", v)
-        for v in re.split(rf"(?<!\\){split}", value, maxsplit=maxsplit)
-    ]
+    # Fast path, nothing is escaped so we can use str.split
+    if "\\" not in value:
+        return value.split(split, maxsplit or -1)
+
+    if pattern is None:
+        pattern = split_pattern(split)
+
+    # Find all (still escaped) items in one scan
+    items: List[str] = pattern.findall(value)
+
+    if maxsplit and len(items) > maxsplit + 1:
+        # Items are separated by exactly one split value, so joining the rest
+        # gives back the remainder of the value
+        items[maxsplit:] = [split.join(items[maxsplit:])]
+
+    # NUL and SOH are used as placeholders below, so fall back to unescaping
+    # each item with a regular expression if they are part of the value
+    if "\0" in value or "\1" in value:
+        return [UNESCAPE_RE.sub(r"\1", item) for item in items]
+
+    # Unescape all items at once: join items with SOH, replace escaped
+    # backslashes with NUL, remove the remaining (escaping) backslashes,
+    # restore the escaped backslashes and split the items again
+    return (
+        "\1".join(items)
+        .replace("\\\\", "\0")
+        .replace("\\", "")
+        .replace("\0", "\\")
+        .split("\1")
+    )
 
 
 def split_dict(
@@ -110,7 +383,13 @@ def split_list(value: str, array: ArrayInfo, field: Optional[str] = None) -> Lis
         lst = []
     else:
         # Split by configured split value, unless it is escaped
-        lst = [array.array_type(v.strip()) for v in escape_split(value, array.split)]
+        items = map(str.strip, escape_split(value, array.split, pattern=array.split_re))
+
+        # Items are already strings, so only convert other types
+        if array.array_type is str:
+            lst = list(items)
+        else:
+            lst = list(map(array.array_type, items))
 
     return lst
 
@@ -130,67 +409,76 @@ def split_arguments(
                                        and ArrayInfo (type + split) as value
         dicts: dict[str, ArrayInfo] -  Dictionary with field name as key
                                        and DictInfo (type + split/kv_split) as value
+
+    The split values are stored back in the namespace, and the namespace
+    attributes are returned as a dictionary (without copying)
     """
-    args_with_list_split = {}
+    values: Dict[str, Any] = vars(args)
 
-    for field, value in vars(args).items():
-        if field in arrays and not isinstance(value, (set, list)):
-            value = split_list(value, arrays[field], field)
+    # Nothing to split for schemas with only scalar fields
+    if not (arrays or dicts):
+        return values
 
-        elif field in dicts and not isinstance(value, dict):
-            value = split_dict(value, dicts[field], field)
+    # Only visit the fields that need to be split
 
-        args_with_list_split[field] = value
+    for field, array in arrays.items():
+        if field in values and not isinstance(values[field], (set, list)):
+            values[field] = split_list(values[field], array, field)
 
-    return args_with_list_split
+    for field, dict_info in dicts.items():
+        if field in values and not isinstance(values[field], dict):
+            values[field] = split_dict(values[field], dict_info, field)
 
+    return values
 
-def build_parser(
-    fields: Dict[str, Dict[str, Any]],
-    description: str,
-    epilog: Optional[str],
-) -> Tuple[argparse.ArgumentParser, Arrays, Dicts]:
+
+@functools.lru_cache(maxsize=None)
+def build_arguments(
+    model: Type["BaseModel"], alias: bool
+) -> Tuple[FieldSpecs, Arrays, Dicts]:
     """
 
-    Build argument parser based on pydantic fields
+    Build argument specification based on pydantic fields
 
-    Return ArgumentParser and fields that are defined as arrays
+    Return field specifications to add to the ArgumentParser and fields that
+    are defined as arrays and dicts. The result is cached per (model, alias)
+    so the schema only is inspected once.
 
     """
 
+    return _fields_arguments(_get_fields(model, alias))
+
+
+def _fields_arguments(
+    fields: Dict[str, Dict[str, Any]],
+) -> Tuple[FieldSpecs, Arrays, Dicts]:
+    """
+    Build argument specification from pydantic fields (schema properties)
+    """
+
+    # Field specifications to add to the parser
+    specs: List[FieldSpec] = []
+
     # Map of all fields that are defined as arrays
     arrays: Arrays = {}
 
     # Map of all fields that are defined as objects (dicts)
     dicts: Dicts = {}
 
-    # Add epilog to --help output
-    if epilog:
-        parser = argparse.ArgumentParser(
-            description,
-            epilog=epilog,
-            formatter_class=argparse.RawDescriptionHelpFormatter,
-        )
-    else:
-        parser = argparse.ArgumentParser(description)
-
     # Example internal data structure for pydantic fields that we parse
     # {
     #   "enabled": {
     # 	    "default": false,
     # 	    "description": "Boolean with default value",
-    # 	    "title": "Enabled",
     # 	    "type": "boolean"
     #   },
     #   "flag1": {
     # 	    "default": true,
     # 	    "description": "Boolean with default value",
-    # 	    "title": "Flag1",
     # 	    "type": "boolean"
     #   },
     #   "str_arg": {
     # 	    "description": "Required String Argument",
-    # 	    "title": "Str Arg",
     # 	    "type": "string"
     #   },
     #   "strlist": {
@@ -199,11 +487,9 @@ def build_parser(
     # 	          "type": "string"
     # 	    },
     # 	    "split": ",",
-    # 	    "title": "Strlist",
     # 	    "type": "array"
     #   },
-    #     "dict_arg": {
-    #     "title": "Dict Arg",
+    #   "dict_arg": {
     #     "description": "Dict ",
     #     "default": {},
     #     "kv_split": ":",
@@ -212,6 +498,7 @@ def build_parser(
     #     "additionalProperties": {
     #         "type": "string"
     #     }
+    #   }
     # }
 
     # Loop over all pydantic schema fields
@@ -221,25 +508,26 @@ def build_parser(
         field_type: type = str
         default = schema.get("default")
 
-        # In pydantic 2.0+ some fields are represented with anyOf, like this:
+        # In the JSON schema from pydantic 1.x, unions are represented with
+        # anyOf (fields from pydantic 2.x are built by _annotation_schema(),
+        # which already picks a single type), like this:
         #
-        # "path": {
+        # "number": {
         #     "anyOf": [
         #         {
-        #             "format": "path",
-        #             "type": "string"
+        #             "type": "integer"
         #         },
         #         {
-        #             "type": "null"
+        #             "type": "string"
         #         }
         #     ],
-        #     "description": "Path",
-        #     "title": "Path"
+        #     "description": "Number",
+        #     "title": "Number"
         #
 
-        for types in schema.get("anyOf", []):
-            if types.get("type") != "null":
-                schema.update(**types)
+        for any_of in schema.get("anyOf", []):
+            if any_of.get("type") != "null":
+                schema.update(**any_of)
 
         if "type" not in schema:
             raise FieldError(
@@ -247,70 +535,143 @@ def build_parser(
                 f"{field}: {schema}"
             )
 
-        if schema["type"] == "array":
-            array_type = TYPE_MAPPING.get(schema["items"]["type"])
-
-            if not array_type:
-                raise FieldError(
-                    f"Unsupported pydantic type for array field {field}: {schema}"
-                )
-
-            arrays[field] = ArrayInfo(
-                array_type=array_type,
-                split=schema.get("split", DEFAULT_SPLIT),
+        schema_type = schema["type"]
+
+        # For arrays (lists, sets etc) and dicts, we parse as str in caep and split
+        # values by configured split value later, so we only need to look up the
+        # type of the items
+        if schema_type == "array":
+            kind = "array field"
+            value_type = TYPE_MAPPING.get(schema.get("items", {}).get("type"))
+        elif schema_type == "object":
+            kind = "dict field"
+            value_type = TYPE_MAPPING.get(
+                schema.get("additionalProperties", {}).get("type")
             )
+        else:
+            kind = "field"
+            value_type = TYPE_MAPPING.get(schema_type)
 
-            # For arrays (lists, sets etc), we parse as str in caep and split values by
-            # configured split value later
-            field_type = str
+        if value_type is None:
+            raise FieldError(f"Unsupported pydantic type for {kind} {field}: {schema}")
 
-        elif schema["type"] == "object":
-            dict_type = TYPE_MAPPING.get(schema["additionalProperties"]["type"])
-
-            if not dict_type:
-                raise FieldError(
-                    f"Unsupported pydantic type for dict field {field}: {schema}"
-                )
+        if schema_type == "array":
+            split = schema.get("split", DEFAULT_SPLIT)
 
+            arrays[field] = ArrayInfo(
+                array_type=value_type,
+                split=split,
+                split_re=split_pattern(split),
+            )
+        elif schema_type == "object":
             dicts[field] = DictInfo(
-                dict_type=dict_type,
+                dict_type=value_type,
                 split=schema.get("split", DEFAULT_SPLIT),
                 kv_split=schema.get("kv_split", DEFAULT_KV_SPLIT),
             )
-
         else:
-            if schema["type"] not in TYPE_MAPPING:
-                raise FieldError(
-                    f"Unsupported pydantic type for field {field}: {schema}"
-                )
-
-            field_type = TYPE_MAPPING[schema["type"]]
+            field_type = value_type
 
-        parser_args: Dict[str, Any] = {}
+        # We know all our arguments are options with a single value, so instead
+        # of the generic add_argument() we instantiate the argparse actions
+        # directly when the parser is built
+        # pylint: disable=protected-access
+        action: Type[argparse.Action] = argparse._StoreAction
 
         if field_type == bool:
             if default in (False, None):
-                parser_args["action"] = "store_true"
+                action = argparse._StoreTrueAction
 
                 # Explicit set default value as False
                 if default is None:
                     default = False
             elif default is True:
-                parser_args["action"] = "store_false"
+                action = argparse._StoreFalseAction
             else:
                 raise FieldError(
                     f"bools only support defaults of False/None/True {field}: {schema}"
                 )
-        else:
-            parser_args = {"type": field_type}
 
-        parser.add_argument(
-            f"--{field.replace('_', '-')}",
-            help=schema.get("description", "No help provided"),
-            default=default,
-            **parser_args,
+        flag = field.translate(_UND2DASH)
+
+        specs.append(
+            FieldSpec(
+                flag=f"--{flag}",
+                dest=flag.translate(_DASH2UND),
+                help=schema.get("description", "No help provided"),
+                default=default,
+                type=field_type if action is argparse._StoreAction else None,
+                action=action,
+            )
         )
 
+    return tuple(specs), arrays, dicts
+
+
+def build_parser(
+    model: Union[Type["BaseModel"], Dict[str, Dict[str, Any]]],
+    description: str,
+    epilog: Optional[str],
+    alias: bool = False,
+) -> Tuple[argparse.ArgumentParser, Arrays, Dicts]:
+    """
+
+    Build argument parser based on pydantic fields
+
+    Return ArgumentParser and fields that are defined as arrays and dicts
+
+    model can also be pydantic fields (schema properties), as in earlier
+    versions. The argument specification is then not cached, and alias is
+    not used.
+
+    """
+
+    if isinstance(model, dict):
+        specs, arrays, dicts = _fields_arguments(model)
+    else:
+        specs, arrays, dicts = build_arguments(model, alias)
+
+    # Add epilog to --help output
+    if epilog:
+        parser = argparse.ArgumentParser(
+            description,
+            epilog=epilog,
+            formatter_class=argparse.RawDescriptionHelpFormatter,
+        )
+    else:
+        parser = argparse.ArgumentParser(description)
+
+    # ArgumentParser is stateful, so create a new parser on each call and
+    # only replay the (cached) field specifications
+    # pylint: disable=protected-access
+    for spec in specs:
+        # The specifications are cached, so copy mutable defaults to avoid
+        # sharing them between loaded configurations. Defaults are represented
+        # as in the JSON schema, so sets are lists and only lists and dicts
+        # are mutable
+        default = spec.default
+
+        if isinstance(default, (list, dict)):
+            default = copy.deepcopy(default)
+
+        if spec.type is None:
+            action = spec.action(
+                option_strings=[spec.flag],
+                dest=spec.dest,
+                default=default,
+                help=spec.help,
+            )
+        else:
+            action = spec.action(
+                option_strings=[spec.flag],
+                dest=spec.dest,
+                default=default,
+                type=spec.type,
+                help=spec.help,
+            )
+
+        parser._add_action(action)
+
     return parser, arrays, dicts
 
 
@@ -325,6 +686,7 @@ def load(
     raise_on_validation_error: bool = False,
     exit_on_validation_error: bool = True,
     epilog: Optional[str] = None,
+    skip_validation: bool = False,
 ) -> BaseModelType:
     """
 
@@ -343,34 +705,34 @@ def load(
         raise_on_validation_error: bool - Reraise validation errors from pydantic
         exit_on_validation_error: bool  - Exit and print help on validation error
         epilog: str                     - Add epilog text to --help output
+        skip_validation: bool           - Construct model without pydantic
+                                          validation (only use with trusted
+                                          configuration sources)
 
     Returns parsed model
 
     """
 
-    # Get all pydantic fields
-    # In pydantix 1.x we use the `schema()` method, but this is replaced with
-    # `model_json_schema` in pydantic 2.x.
-
-    if PYDANTIC_MAJOR_VERSION == "2":
-        fields = model.model_json_schema(alias).get("properties")
-    else:
-        fields = model.schema(alias).get("properties")
-
-    if not fields:
-        raise SchemaError(f"Unable to get properties from schema {model}")
+    from pydantic import ValidationError
 
     # Build argument parser based on pydantic fields
-    parser, arrays, dicts = build_parser(fields, description, epilog)
+    parser, arrays, dicts = build_parser(model, description, epilog, alias)
 
     args = split_arguments(
-        args=caep.config.handle_args(
+        args=config.handle_args(
             parser, config_id, config_file_name, section_name, opts=opts
         ),
         arrays=arrays,
         dicts=dicts,
     )
 
+    if skip_validation:
+        # Values are already typed by argparse and split_arguments, so we can
+        # construct the model directly without running the validators
+        if pydantic_major_version() == "2":
+            return model.model_construct(**args)
+        return model.construct(**args)
+
     try:
         return cast(BaseModelType, model(**args))  # type: ignore
     except ValidationError as e:
@@ -382,11 +744,14 @@ def load(
             #                          'msg': 'none is not an allowed value',
             #                          'type': 'type_error.none.not_allowed'}])
 
+            # Buffer errors and help, and write everything to stderr at once
+            output = io.StringIO()
+
             for error in e.errors():
-                argument = cast(str, error.get("loc", [])[0]).replace("_", "-")
-                msg = error.get("msg")
+                argument = str(error["loc"][0]).translate(_UND2DASH)
 
-                print(f"{msg} for --{argument}\n")
+                output.write(f"{error['msg']} for --{argument}\n\n")
 
-            parser.print_help()
+            output.write(parser.format_help())
+            sys.stderr.write(output.getvalue())
             sys.exit(1)
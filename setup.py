@@ -22,10 +22,11 @@ setup(
     keywords="mnemonic",
     packages=["caep"],
     url="https://github.com/mnemonic-no/caep",
-    python_requires=">=3.6, <4",
+    python_requires=">=3.7, <4",
     package_data={"caep": ["py.typed"]},
     install_requires=[
         "pydantic",
+        "typing_extensions",
     ],
     extras_require={
         "dev": [
@@ -1,13 +1,18 @@
 """ test config """
 
+import dataclasses
+import enum
 import ipaddress
 import os
 import shlex
+import subprocess
+import sys
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Type
+from typing import Any, Dict, List, Optional, Set, Tuple, Type, Union
 
 import pytest
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import AliasChoices, AliasPath, BaseModel, Field, ValidationError
+from typing_extensions import Annotated, Literal, TypedDict
 
 import caep
 from caep.schema import (
@@ -117,6 +122,80 @@ class ArgCombined(Arg1, Arg2, Arg3):
     pass
 
 
+class AliasArgs(BaseModel):
+    str_arg: str = Field("Unset", description="String argument", alias="str_alias")
+    intlist: Optional[List[int]] = Field(
+        None, description="Optional list of ints", json_schema_extra={"split": " "}
+    )
+
+
+class AliasChoicesArgs(BaseModel):
+    port: Optional[int] = Field(
+        None, description="Port", validation_alias=AliasChoices("p", "port_number")
+    )
+    host: str = Field(
+        "localhost",
+        description="Host",
+        validation_alias=AliasChoices(AliasPath("server", "host"), "server_host"),
+    )
+
+
+class AnnotationArgs(BaseModel):
+    opt_int: Optional[int] = Field(None, description="Optional int")
+    union: Union[int, str] = Field(1, description="Union of int and str")
+    literal: Literal["a", "b"] = Field("a", description="Literal strings")
+    literal_int: Literal[1, 2] = Field(1, description="Literal ints")
+    annotated: List[Annotated[int, "meta"]] = Field(
+        [1], description="List of annotated ints"
+    )
+    int_tuple: Tuple[int, ...] = Field((1, 2), description="Tuple of ints")
+    opt_set: Optional[Set[str]] = Field(None, description="Optional set")
+    float_dict: Dict[str, float] = Field({}, description="Dict of floats")
+    path: Optional[Path] = Field(None, description="Path")
+
+
+@dataclasses.dataclass
+class DataclassArg:
+    value: int = 0
+
+
+class DataclassArgs(BaseModel):
+    dc: Optional[DataclassArg] = Field(None, description="Dataclass")
+
+
+class TypedDictArg(TypedDict):
+    value: int
+
+
+class TypedDictArgs(BaseModel):
+    td: TypedDictArg = Field(description="TypedDict")
+
+
+class Color(enum.Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+class EnumArgs(BaseModel):
+    color: Color = Field(Color.RED, description="Enum")
+
+
+class MixedTupleArgs(BaseModel):
+    mixed: Tuple[int, str] = Field((1, "a"), description="Tuple of int and str")
+
+
+class AnyArgs(BaseModel):
+    any_arg: Any = Field(None, description="Any")
+
+
+class NoneArgs(BaseModel):
+    none_arg: None = Field(None, description="None")
+
+
+class MixedLiteralArgs(BaseModel):
+    literal: Literal[1, "a"] = Field(1, description="Literal int and str")
+
+
 def parse_args(
     model: Type[caep.schema.BaseModelType],
     commandline: Optional[List[str]] = None,
@@ -416,3 +495,178 @@ def test_split_dict() -> None:
 
     with pytest.raises(FieldError):
         split_dict("a,b", DictInfo(dict_type=str))
+
+
+def test_schema_repeated_load() -> None:
+    """Parser arguments are cached, but each load should parse its own options"""
+
+    config1 = parse_args(ArgCombined, shlex.split("--str-arg arg1 --number 10"))
+    config2 = parse_args(ArgCombined, shlex.split("--str-arg arg2 --enabled"))
+
+    assert config1.str_arg == "arg1"
+    assert config1.number == 10
+    assert config1.enabled is False
+
+    assert config2.str_arg == "arg2"
+    assert config2.number == 1
+    assert config2.enabled is True
+
+    assert caep.schema.build_arguments.cache_info().hits > 0
+
+
+def test_schema_skip_validation() -> None:
+    """Construct model without validation"""
+    commandline = shlex.split(
+        "--str-arg test --number 10 --intlist '1 2' --strlist a,b"
+    )
+
+    config = caep.load(Arguments, "Description", opts=commandline, skip_validation=True)
+
+    assert config.str_arg == "test"
+    assert config.number == 10
+    assert config.intlist == [1, 2]
+    assert config.strlist == ["a", "b"]
+    assert config.enabled is False
+    assert config.flag1 is True
+
+
+def test_schema_skip_validation_mutable_defaults() -> None:
+    """Changing defaults in a loaded config should not change later loads"""
+
+    config = caep.load(
+        ListSetDictDefaults, "Description", opts=[], skip_validation=True
+    )
+
+    config.strlist2.append("ddd")
+    config.dict2["e"] = "f"
+
+    config = caep.load(ListSetDictDefaults, "Description", opts=[])
+
+    assert config.strlist2 == ["aaa", "bbb", "ccc"]
+    assert config.dict2 == {"a": "b", "c": "d"}
+
+
+def test_escape_split_special_characters() -> None:
+    """Split values are matched literally, not as regular expressions"""
+    assert escape_split("a.b.c", split=".") == ["a", "b", "c"]
+    assert escape_split("a|b\\|c", split="|") == ["a", "b|c"]
+
+    assert split_list("1.2.3", ArrayInfo(array_type=int, split=".")) == [1, 2, 3]
+
+
+def test_escape_split_escaped_backslash() -> None:
+    # Escaped backslash followed by split value
+    assert escape_split("A\\\\,B") == ["A\\", "B"]
+
+    # Max split
+    assert escape_split("a:b:c", split=":", maxsplit=1) == ["a", "b:c"]
+    assert escape_split("a\\:b:c", split=":", maxsplit=1) == ["a:b", "c"]
+
+
+def test_schema_unsupported_array_type() -> None:
+    """Nested lists are not supported"""
+
+    class NestedList(BaseModel):
+        nested: List[List[int]] = Field(description="List of lists")
+
+    with pytest.raises(FieldError):
+        parse_args(NestedList, [])
+
+
+def test_import_without_pydantic() -> None:
+    """pydantic should not be imported until it is used"""
+    code = "import sys, caep; assert 'pydantic' not in sys.modules"
+
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_schema_validation_error_stderr(capsys) -> None:  # type: ignore
+    """Validation errors and help are written to stderr"""
+
+    with pytest.raises(SystemExit):
+        parse_args(Arguments)
+
+    captured = capsys.readouterr()
+
+    assert "for --str-arg" in captured.err
+    assert "usage:" in captured.err
+    assert captured.out == ""
+
+
+def test_build_parser_fields() -> None:
+    """build_parser() still accepts pydantic fields (schema properties)"""
+    fields = Arguments.model_json_schema()["properties"]
+
+    parser, arrays, dicts = caep.schema.build_parser(fields, "Description", None)
+
+    args = parser.parse_args(shlex.split("--str-arg value --intlist '1 2 3'"))
+
+    assert args.str_arg == "value"
+    assert args.intlist == "1 2 3"
+    assert arrays["intlist"].split == " "
+    assert dicts["dict_int"].kv_split == "/"
+
+
+def test_schema_alias() -> None:
+    """Fields with alias and optional lists"""
+    commandline = shlex.split("--str-alias value --intlist '1 2 3'")
+
+    config = caep.load(AliasArgs, "Description", opts=commandline, alias=True)
+
+    assert config.str_arg == "value"
+    assert config.intlist == [1, 2, 3]
+
+
+def test_schema_alias_choices() -> None:
+    """Fields with alias choices use the first str choice as in the JSON schema"""
+    commandline = shlex.split("--p 5 --server-host example.com")
+
+    config = caep.load(AliasChoicesArgs, "Description", opts=commandline, alias=True)
+
+    assert config.port == 5
+    assert config.host == "example.com"
+
+
+def json_schema_arguments(
+    model: Type[BaseModel], monkeypatch: pytest.MonkeyPatch
+) -> Any:
+    """Field specifications built from model_json_schema(), as before model_fields"""
+    monkeypatch.setattr(
+        caep.schema,
+        "_get_fields",
+        lambda model, alias: model.model_json_schema(alias)["properties"],
+    )
+
+    return caep.schema.build_arguments.__wrapped__(model, False)
+
+
+def test_annotation_schema(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Fields from model_fields should match fields from the JSON schema"""
+
+    arguments = caep.schema.build_arguments(AnnotationArgs, False)
+
+    assert arguments == json_schema_arguments(AnnotationArgs, monkeypatch)
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        DataclassArgs,
+        TypedDictArgs,
+        EnumArgs,
+        MixedTupleArgs,
+        AnyArgs,
+        NoneArgs,
+        MixedLiteralArgs,
+    ],
+)
+def test_annotation_schema_unsupported(
+    model: Type[BaseModel], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Nested models, enums, mixed tuples/literals, Any and None are not supported"""
+
+    with pytest.raises(FieldError):
+        caep.schema.build_arguments(model, False)
+
+    with pytest.raises(FieldError):
+        json_schema_arguments(model, monkeypatch)